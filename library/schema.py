@@ -2,9 +2,17 @@
 
 from __future__ import annotations
 
-from typing import List, Optional, Literal
+import copy
+import functools
+import json
+from typing import Any, Callable, List, Optional, Literal, get_args
 
-from pydantic import AnyUrl, BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
 
 
 Platform = Literal[
@@ -16,6 +24,10 @@ Platform = Literal[
     "windows/amd64",
 ]
 
+PLATFORMS: frozenset[str] = frozenset(get_args(Platform))
+
+GIT_REPO_PATTERN = r"^((https?|ssh|git)://|git@)\S+$"
+
 
 class Maintainer(BaseModel):
     """Details about the maintainer of the image."""
@@ -37,16 +49,17 @@ class Maintainer(BaseModel):
         description="GitLab Username.",
     )
 
-    model_config = ConfigDict(extra="forbid", validate_assignment=True)
+    model_config = ConfigDict(extra="forbid", frozen=True, defer_build=True)
 
 
 class Git(BaseModel):
     """Repository information for the image build source."""
 
-    repo: AnyUrl = Field(
+    repo: str = Field(
         ...,
         title="Repository",
         description="Git repository.",
+        pattern=GIT_REPO_PATTERN,
         examples=["https://github.com/opencadc/canfar-library"],
     )
     tag: str = Field(
@@ -56,7 +69,7 @@ class Git(BaseModel):
         examples=["refs/tags/v1.0.0", "v1.0.0"],
     )
 
-    model_config = ConfigDict(extra="forbid", validate_assignment=True)
+    model_config = ConfigDict(extra="forbid", frozen=True, defer_build=True)
 
 
 class Build(BaseModel):
@@ -86,13 +99,13 @@ class Build(BaseModel):
         description="Builder backend used for this entry.",
         examples=["buildkit"],
     )
-    platforms: list[Platform] = Field(
-        default=["linux/amd64"],
+    platforms: tuple[Platform, ...] = Field(
+        default=("linux/amd64",),
         title="Target Platforms",
         description="Target platforms.",
         examples=[["linux/amd64"], ["linux/amd64", "linux/arm64"]],
     )
-    tags: List[str] = Field(
+    tags: tuple[str, ...] = Field(
         ...,
         title="Container Image Tags",
         description="Image tags.",
@@ -135,7 +148,7 @@ class Build(BaseModel):
         examples=["bash -c 'echo hello world'", "bash -c ./test.sh"],
     )
 
-    model_config = ConfigDict(extra="forbid", validate_assignment=True)
+    model_config = ConfigDict(extra="forbid", frozen=True, defer_build=True)
 
 
 class Metadata(BaseModel):
@@ -146,6 +159,8 @@ class Metadata(BaseModel):
     identifier: str = Field(..., description="Unique science identifier for the image.")
     project: str = Field(..., description="SRCnet Project name for the image.")
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
 
 class Manifest(BaseModel):
     """CANFAR Container Library Schema."""
@@ -162,7 +177,7 @@ class Manifest(BaseModel):
 
     model_config = ConfigDict(
         extra="forbid",
-        validate_assignment=True,
+        frozen=True,
         json_schema_extra={
             "$schema": "https://json-schema.org/draft/2020-12/schema",
             "$id": "https://raw.githubusercontent.com/opencadc/canfar-library/main/.spec.json",
@@ -172,8 +187,99 @@ class Manifest(BaseModel):
     )
 
 
+MANIFEST_ADAPTER: TypeAdapter[Manifest] = TypeAdapter(Manifest)
+MANIFEST_LIST_ADAPTER: TypeAdapter[list[Manifest]] = TypeAdapter(list[Manifest])
+
+
+def validate_manifest(data: Any) -> Manifest:
+    """Validate a parsed manifest (e.g. loaded from YAML) into a `Manifest`."""
+    return MANIFEST_ADAPTER.validate_python(data)
+
+
+def validate_manifest_json(raw: str | bytes) -> Manifest:
+    """Validate raw JSON manifest content without an intermediate `json.loads`."""
+    return MANIFEST_ADAPTER.validate_json(raw)
+
+
+def validate_manifests(data: Any) -> list[Manifest]:
+    """Validate a batch of parsed manifests in a single validator call."""
+    return MANIFEST_LIST_ADAPTER.validate_python(data)
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_schema() -> dict[str, Any]:
+    """Build the JSON Schema for `Manifest` once; never handed out directly."""
+    return Manifest.model_json_schema()
+
+
+def get_schema() -> dict[str, Any]:
+    """Return the JSON Schema for `Manifest`.
+
+    The schema is built once and cached privately; every call returns a deep
+    copy, so callers may mutate the result without affecting later calls or
+    `get_schema_json`.
+    """
+    return copy.deepcopy(_cached_schema())
+
+
+@functools.lru_cache(maxsize=1)
+def get_schema_json() -> str:
+    """Return the JSON Schema for `Manifest` serialized as indented JSON.
+
+    Uses `orjson` when it is installed, falling back to the stdlib `json`.
+    """
+    if orjson is not None:
+        return orjson.dumps(_cached_schema(), option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(_cached_schema(), indent=2, ensure_ascii=False)
+
+
+@functools.lru_cache(maxsize=1)
+def _compiled_schema_validator() -> Optional[Callable[[Any], bool]]:
+    """Compile the JSON Schema into a `fastjsonschema` check, if installed.
+
+    `fastjsonschema` is imported here rather than at module level so that
+    importing `library.schema` does not pay for it. It rewrites `$ref`s in
+    the schema it compiles, which is safe because `get_schema` returns a
+    private copy.
+    """
+    try:
+        import fastjsonschema
+    except ImportError:  # pragma: no cover - optional speedup
+        return None
+
+    validate = fastjsonschema.compile(get_schema(), use_default=False)
+
+    def check(data: Any) -> bool:
+        try:
+            validate(data)
+        except fastjsonschema.JsonSchemaException:
+            return False
+        return True
+
+    return check
+
+
+def is_valid_manifest(data: Any) -> bool:
+    """Check whether parsed manifest data conforms to the schema.
+
+    Uses a compiled `fastjsonschema` validator when it is installed, which
+    skips building any model instances, and falls back to pydantic otherwise.
+
+    `data` must be JSON-compatible: dicts with string keys, lists, strings,
+    numbers, booleans and None, as produced by `json.loads`. Other Python
+    types (non-string keys, sets, bytes) may be judged differently by the two
+    backends; use `validate_manifest` for arbitrary Python input.
+    """
+    check = _compiled_schema_validator()
+    if check is not None:
+        return check(data)
+    try:
+        MANIFEST_ADAPTER.validate_python(data)
+    except ValidationError:
+        return False
+    return True
+
+
 if __name__ == "__main__":
     # Emit the JSON Schema that downstream tools can consume.
-    import json
-
-    print(json.dumps(Manifest.model_json_schema(), indent=2))
+    print(get_schema_json())
@@ -0,0 +1,74 @@
+"""Lightweight dataclass mirror of the CANFAR Library manifest schema.
+
+These classes perform no validation and are meant for tools that build
+manifests programmatically. Use `to_manifest` to validate the result against
+the canonical pydantic models in `library.schema`.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from dataclasses import dataclass
+from typing import Optional
+
+from library.schema import MANIFEST_ADAPTER, Platform
+from library.schema import Manifest as ManifestModel
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Maintainer:
+    """Details about the maintainer of the image."""
+
+    name: str
+    email: str
+    github: Optional[str] = None
+    gitlab: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Git:
+    """Repository information for the image build source."""
+
+    repo: str
+    tag: str
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Build:
+    """Configuration for building the container image."""
+
+    tags: tuple[str, ...]
+    path: str = "."
+    dockerfile: str = "Dockerfile"
+    context: str = "."
+    builder: str = "buildkit"
+    platforms: tuple[Platform, ...] = ("linux/amd64",)
+    args: Optional[dict[str, str]] = None
+    annotations: Optional[dict[str, str]] = None
+    labels: Optional[dict[str, str]] = None
+    target: Optional[str] = None
+    test: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Metadata:
+    """Metadata for the image."""
+
+    identifier: str
+    project: str
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Manifest:
+    """CANFAR Container Library manifest."""
+
+    name: str
+    maintainers: tuple[Maintainer, ...]
+    git: Git
+    build: Build
+    metadata: Metadata
+
+
+def to_manifest(manifest: Manifest) -> ManifestModel:
+    """Validate a dataclass manifest into the canonical pydantic `Manifest`."""
+    return MANIFEST_ADAPTER.validate_python(dataclasses.asdict(manifest))
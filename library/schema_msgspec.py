@@ -0,0 +1,75 @@
+"""msgspec mirror of the CANFAR Library manifest schema.
+
+For consumers that decode large numbers of JSON manifests and only need typed,
+read-only access. `library.schema` remains the source of truth for the
+published JSON Schema.
+"""
+
+from __future__ import annotations
+
+from typing import Annotated, Optional
+
+import msgspec
+
+from library.schema import GIT_REPO_PATTERN, Platform
+
+# msgspec matches patterns with Python's `re`, where `$` also matches before a
+# trailing newline; anchor with `\Z` to reject the same inputs as pydantic.
+_GIT_REPO_PATTERN = GIT_REPO_PATTERN.removesuffix("$") + r"\Z"
+
+
+class Maintainer(msgspec.Struct, frozen=True, kw_only=True, forbid_unknown_fields=True):
+    """Details about the maintainer of the image."""
+
+    name: str
+    email: str
+    github: Optional[str] = None
+    gitlab: Optional[str] = None
+
+
+class Git(msgspec.Struct, frozen=True, kw_only=True, forbid_unknown_fields=True):
+    """Repository information for the image build source."""
+
+    repo: Annotated[str, msgspec.Meta(pattern=_GIT_REPO_PATTERN)]
+    tag: str
+
+
+class Build(msgspec.Struct, frozen=True, kw_only=True, forbid_unknown_fields=True):
+    """Configuration for building the container image."""
+
+    path: str = "."
+    dockerfile: str = "Dockerfile"
+    context: str = "."
+    builder: str = "buildkit"
+    platforms: tuple[Platform, ...] = ("linux/amd64",)
+    tags: tuple[str, ...]
+    args: Optional[dict[str, str]] = None
+    annotations: Optional[dict[str, str]] = None
+    labels: Optional[dict[str, str]] = None
+    target: Optional[str] = None
+    test: Optional[str] = None
+
+
+class Metadata(msgspec.Struct, frozen=True, kw_only=True):
+    """Metadata for the image."""
+
+    identifier: str
+    project: str
+
+
+class Manifest(msgspec.Struct, frozen=True, kw_only=True, forbid_unknown_fields=True):
+    """CANFAR Container Library manifest."""
+
+    name: str
+    maintainers: tuple[Maintainer, ...]
+    git: Git
+    build: Build
+    metadata: Metadata
+
+
+MANIFEST_DECODER: msgspec.json.Decoder[Manifest] = msgspec.json.Decoder(Manifest)
+
+
+def decode_manifest(raw: str | bytes) -> Manifest:
+    """Decode and validate a JSON manifest in a single pass."""
+    return MANIFEST_DECODER.decode(raw)
@@ -1,11 +1,11 @@
 from pathlib import Path
-from library.schema import Manifest
+from library.schema import get_schema
 from jsonschema_markdown import generate  # type: ignore
 
 
 def generate_schema_markdown(path: Path = Path("docs/schema.md")):
     """Generate Markdown documentation from the JSON Schema."""
-    schema = Manifest.model_json_schema()
+    schema = get_schema()
     output = generate(schema, footer=False, hide_empty_columns=True)
     header = """---\nhide: \n    - toc\n---\n\n"""
     output = header + output
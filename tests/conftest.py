@@ -0,0 +1,22 @@
+"""Shared fixtures for the library tests."""
+
+import copy
+from typing import Any
+
+VALID: dict[str, Any] = {
+    "name": "base",
+    "maintainers": [{"name": "Jane Doe", "email": "jane@example.org"}],
+    "git": {"repo": "https://github.com/opencadc/canfar-library", "tag": "v0.1.0"},
+    "build": {"tags": ["latest"], "platforms": ["linux/amd64", "linux/arm64"]},
+    "metadata": {"identifier": "canfar-base", "project": "canfar"},
+}
+
+
+def with_value(path: tuple[str | int, ...], value: Any) -> dict[str, Any]:
+    """Return a deep copy of `VALID` with the item at `path` set to `value`."""
+    data = copy.deepcopy(VALID)
+    target: Any = data
+    for key in path[:-1]:
+        target = target[key]
+    target[path[-1]] = value
+    return data
@@ -0,0 +1,148 @@
+"""Tests for library.schema."""
+
+import copy
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+from conftest import VALID, with_value
+from pydantic import ValidationError
+
+import library.schema
+from library.schema import (
+    Manifest,
+    _compiled_schema_validator,
+    get_schema,
+    get_schema_json,
+    is_valid_manifest,
+    validate_manifest,
+    validate_manifest_json,
+    validate_manifests,
+)
+
+ROOT = Path(__file__).resolve().parents[1]
+SPEC = ROOT / ".spec.json"
+MANIFESTS = sorted((ROOT / "manifests").glob("*.yaml"))
+
+CASES = [
+    pytest.param(VALID, id="valid"),
+    pytest.param({}, id="empty"),
+    pytest.param({k: v for k, v in VALID.items() if k != "git"}, id="missing-git"),
+    pytest.param(with_value(("extra",), "x"), id="extra-field"),
+    pytest.param(with_value(("git", "repo"), "ftp://example.org/x"), id="bad-repo"),
+    pytest.param(
+        with_value(("build", "platforms"), ["linux/s390x"]), id="bad-platform"
+    ),
+    pytest.param(with_value(("build", "tags"), [2026.1]), id="non-string-tag"),
+    pytest.param(with_value(("maintainers", 0, "email"), None), id="null-email"),
+]
+
+# Not JSON-compatible: the fastjsonschema path and pydantic may disagree, so
+# only the pydantic fallback is checked against `validate_manifest`.
+NON_JSON_CASES = [
+    pytest.param(with_value(("build", "labels"), {1: "a"}), id="int-label-key"),
+    pytest.param(with_value(("build", "tags"), {"a"}), id="set-tags"),
+    pytest.param(with_value(("name",), b"abc"), id="bytes-name"),
+]
+
+
+def _pydantic_accepts(data: Any) -> bool:
+    try:
+        validate_manifest(data)
+    except ValidationError:
+        return False
+    return True
+
+
+@pytest.mark.parametrize("encode", [json.dumps, lambda d: json.dumps(d).encode()])
+def test_validate_manifest_json_matches_python(encode: Any) -> None:
+    assert validate_manifest_json(encode(VALID)) == validate_manifest(VALID)
+
+
+def test_validate_manifest_json_rejects_invalid() -> None:
+    with pytest.raises(ValidationError):
+        validate_manifest_json(json.dumps(with_value(("extra",), "x")))
+    with pytest.raises(ValidationError):
+        validate_manifest_json(b"{not json")
+
+
+def test_validate_manifests_returns_list() -> None:
+    other = with_value(("name",), "other")
+    manifests = validate_manifests([VALID, other])
+
+    assert manifests == [validate_manifest(VALID), validate_manifest(other)]
+
+
+def test_validate_manifests_reports_item_index() -> None:
+    bad = with_value(("git", "repo"), "ftp://example.org/x")
+    with pytest.raises(ValidationError) as exc_info:
+        validate_manifests([VALID, bad, VALID])
+
+    errors = exc_info.value.errors()
+    assert [e["loc"] for e in errors] == [(1, "git", "repo")]
+
+
+def test_get_schema_matches_model() -> None:
+    assert get_schema() == Manifest.model_json_schema()
+
+
+def test_get_schema_returns_private_copy() -> None:
+    schema = get_schema()
+    schema["$defs"]["Git"]["properties"].clear()
+    schema["title"] = "mutated"
+
+    assert get_schema() == Manifest.model_json_schema()
+    assert json.loads(get_schema_json()) == Manifest.model_json_schema()
+
+
+def test_get_schema_json_matches_spec() -> None:
+    assert get_schema_json() + "\n" == SPEC.read_text()
+
+
+def test_get_schema_json_fallback_matches_spec(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(library.schema, "orjson", None)
+    get_schema_json.cache_clear()
+    try:
+        assert get_schema_json() + "\n" == SPEC.read_text()
+    finally:
+        get_schema_json.cache_clear()
+
+
+def test_is_valid_manifest_leaves_schema_untouched() -> None:
+    is_valid_manifest({})
+    is_valid_manifest(VALID)
+
+    assert get_schema() == Manifest.model_json_schema()
+    assert get_schema_json() + "\n" == SPEC.read_text()
+
+
+def test_is_valid_manifest_does_not_mutate_input() -> None:
+    data = copy.deepcopy(VALID)
+    assert is_valid_manifest(data)
+    assert data == VALID
+
+
+@pytest.mark.parametrize("data", CASES)
+def test_is_valid_manifest_agrees_with_pydantic(data: Any) -> None:
+    pytest.importorskip("fastjsonschema")
+    assert is_valid_manifest(data) is _pydantic_accepts(data)
+
+
+@pytest.mark.parametrize("data", CASES + NON_JSON_CASES)
+def test_is_valid_manifest_fallback(data: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "fastjsonschema", None)
+    _compiled_schema_validator.cache_clear()
+    try:
+        assert is_valid_manifest(data) is _pydantic_accepts(data)
+    finally:
+        _compiled_schema_validator.cache_clear()
+
+
+@pytest.mark.parametrize("path", MANIFESTS, ids=lambda p: p.name)
+def test_library_manifests_validate(path: Path) -> None:
+    yaml = pytest.importorskip("yaml")
+    data = yaml.safe_load(path.read_text())
+    validate_manifest(data)
+    assert is_valid_manifest(data)
@@ -0,0 +1,60 @@
+"""Tests for library.schema_dc."""
+
+import dataclasses
+
+import pytest
+from conftest import VALID, with_value
+from pydantic import BaseModel
+
+from library import schema, schema_dc
+
+PAIRS = [
+    (schema_dc.Maintainer, schema.Maintainer),
+    (schema_dc.Git, schema.Git),
+    (schema_dc.Build, schema.Build),
+    (schema_dc.Metadata, schema.Metadata),
+    (schema_dc.Manifest, schema.Manifest),
+]
+
+
+@pytest.mark.parametrize(
+    ("mirror", "model"), PAIRS, ids=[model.__name__ for _, model in PAIRS]
+)
+def test_fields_and_defaults_match_model(mirror: type, model: type[BaseModel]) -> None:
+    fields = {f.name: f for f in dataclasses.fields(mirror)}
+    assert fields.keys() == model.model_fields.keys()
+    for name, info in model.model_fields.items():
+        if info.is_required():
+            assert fields[name].default is dataclasses.MISSING, name
+        else:
+            assert fields[name].default == info.default, name
+
+
+def test_to_manifest_applies_model_defaults() -> None:
+    manifest = schema_dc.Manifest(
+        name="base",
+        maintainers=(schema_dc.Maintainer(name="Jane Doe", email="jane@example.org"),),
+        git=schema_dc.Git(
+            repo="https://github.com/opencadc/canfar-library", tag="v0.1.0"
+        ),
+        build=schema_dc.Build(tags=("latest",)),
+        metadata=schema_dc.Metadata(identifier="canfar-base", project="canfar"),
+    )
+    expected = with_value(("build",), {"tags": ["latest"]})
+
+    assert schema_dc.to_manifest(manifest) == schema.validate_manifest(expected)
+
+
+def test_to_manifest_matches_validate_manifest() -> None:
+    manifest = schema_dc.Manifest(
+        name=VALID["name"],
+        maintainers=tuple(schema_dc.Maintainer(**m) for m in VALID["maintainers"]),
+        git=schema_dc.Git(**VALID["git"]),
+        build=schema_dc.Build(
+            tags=tuple(VALID["build"]["tags"]),
+            platforms=tuple(VALID["build"]["platforms"]),
+        ),
+        metadata=schema_dc.Metadata(**VALID["metadata"]),
+    )
+
+    assert schema_dc.to_manifest(manifest) == schema.validate_manifest(VALID)
@@ -0,0 +1,48 @@
+"""Tests for library.schema_msgspec."""
+
+import json
+from typing import Any
+
+import pytest
+from conftest import VALID, with_value
+from pydantic import ValidationError
+
+from library.schema import validate_manifest_json
+
+msgspec = pytest.importorskip("msgspec")
+
+from library.schema_msgspec import decode_manifest  # noqa: E402
+
+CASES = [
+    pytest.param(VALID, id="valid"),
+    pytest.param(
+        with_value(("git", "repo"), "git@github.com:opencadc/x.git"), id="scp-repo"
+    ),
+    pytest.param(
+        with_value(("git", "repo"), "https://github.com/x\n"), id="repo-newline"
+    ),
+    pytest.param(with_value(("git", "repo"), "ftp://example.org/x"), id="bad-repo"),
+    pytest.param(with_value(("extra",), 1), id="extra-field"),
+    pytest.param(with_value(("metadata", "extra"), 1), id="metadata-extra"),
+    pytest.param(
+        with_value(("build", "platforms"), ["linux/s390x"]), id="bad-platform"
+    ),
+    pytest.param(with_value(("build", "tags"), [2026.1]), id="non-string-tag"),
+    pytest.param({k: v for k, v in VALID.items() if k != "build"}, id="no-build"),
+]
+
+
+def _accepts(decode: Any, raw: bytes, *errors: type[Exception]) -> bool:
+    try:
+        decode(raw)
+    except errors:
+        return False
+    return True
+
+
+@pytest.mark.parametrize("data", CASES)
+def test_decode_manifest_agrees_with_pydantic(data: dict[str, Any]) -> None:
+    raw = json.dumps(data).encode()
+    assert _accepts(decode_manifest, raw, msgspec.ValidationError) is _accepts(
+        validate_manifest_json, raw, ValidationError
+    )